@@ -1,16 +1,20 @@
 #  Copyright (c) 2021, Manfred Moitzi
 #  License: MIT License
-from typing import TYPE_CHECKING, Iterable, Dict, Optional
+from typing import TYPE_CHECKING, Iterable, Dict, Optional, Tuple, Union
+from contextlib import contextmanager
+import itertools
+import math
 import warnings
 
 import ezdxf
 from ezdxf import disassemble
-from ezdxf.math import BoundingBox
+from ezdxf.math import BoundingBox, Vec3
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFEntity
 
 MAX_FLATTENING_DISTANCE = disassemble.Primitive.max_flattening_distance
+_REDUCE_CHUNK_SIZE = 4096
 
 
 class Cache:
@@ -21,8 +25,11 @@ class Cache:
 
     """
 
+    __slots__ = ("_boxes", "_use_uuid", "hits", "misses")
+
     def __init__(self, uuid=False):
-        self._boxes: Dict[str, BoundingBox] = dict()
+        # key is the entity handle as hex string or the UUID as int:
+        self._boxes: Dict[Union[str, int], BoundingBox] = dict()
         self._use_uuid = bool(uuid)
         self.hits: int = 0
         self.misses: int = 0
@@ -36,23 +43,39 @@ class Cache:
 
     def get(self, entity: "DXFEntity") -> Optional[BoundingBox]:
         assert entity is not None
+        return self._get_with_key(entity)[1]
+
+    def store(self, entity: "DXFEntity", box: BoundingBox) -> None:
+        """Store bounding `box` for DXF `entity`, ignores empty bounding
+        boxes, therefore all cached bounding boxes have data.
+        """
+        assert entity is not None
+        if box.has_data:
+            self._store_by_key(self._get_key(entity), box)
+
+    def _get_with_key(
+        self, entity: "DXFEntity"
+    ) -> Tuple[Union[str, int, None], Optional[BoundingBox]]:
+        """Returns the cache key and the cached bounding box or ``None``.
+        The returned key can be reused by :meth:`_store_by_key` to avoid a
+        second key calculation.
+        """
         key = self._get_key(entity)
         if key is None:
             self.misses += 1
-            return None
+            return None, None
         box = self._boxes.get(key)
         if box is None:
             self.misses += 1
         else:
             self.hits += 1
-        return box
+        return key, box
 
-    def store(self, entity: "DXFEntity", box: BoundingBox) -> None:
-        assert entity is not None
-        key = self._get_key(entity)
-        if key is None:
-            return
-        self._boxes[key] = box
+    def _store_by_key(
+        self, key: Union[str, int, None], box: BoundingBox
+    ) -> None:
+        if key is not None:
+            self._boxes[key] = box
 
     def invalidate(self, entities: Iterable["DXFEntity"]) -> None:
         """Invalidate cache entries for the given DXF `entities`.
@@ -64,14 +87,16 @@ class Cache:
         Ignores entities which are not stored in cache.
 
         """
-        for entity in entities:
-            try:
-                del self._boxes[self._get_key(entity)]  # type: ignore
-            except KeyError:
-                pass
-
-    def _get_key(self, entity: "DXFEntity") -> Optional[str]:
-        if entity.dxftype() == "HATCH":
+        boxes = self._boxes
+        keys = {
+            key for key in map(self._get_key, entities) if key is not None
+        }
+        for key in keys.intersection(boxes.keys()):
+            del boxes[key]
+
+    def _get_key(self, entity: "DXFEntity") -> Union[str, int, None]:
+        # The class attribute DXFTYPE is faster than the dxftype() method:
+        if entity.DXFTYPE == "HATCH":
             # Special treatment for multiple primitives for the same
             # HATCH entity - all have the same handle:
             # Do not store boundary path they are not distinguishable,
@@ -80,7 +105,10 @@ class Cache:
 
         key = entity.dxf.handle
         if key is None or key == "0":
-            return str(entity.uuid) if self._use_uuid else None
+            # The integer representation of the UUID is much faster than
+            # the string representation and the handle strings do not
+            # collide with integer keys:
+            return entity.uuid.int if self._use_uuid else None
         else:
             return key
 
@@ -123,18 +151,19 @@ def multi_recursive(
         if primitive.is_empty:
             continue
 
-        entity = primitive.entity
         if cache is not None:
-            box = cache.get(entity)
+            key, box = cache._get_with_key(primitive.entity)
             if box is None:
                 box = primitive.bbox(fast=fast)
-                if box.has_data:
-                    cache.store(entity, box)
+                if not box.has_data:
+                    continue
+                cache._store_by_key(key, box)
+            # cached bounding boxes always have data
+            yield box
         else:
             box = primitive.bbox(fast=fast)
-
-        if box.has_data:
-            yield box
+            if box.has_data:
+                yield box
 
 
 def extents(
@@ -164,14 +193,58 @@ def extents(
 
     """
     fast = _resolve_fast_arg(fast, kwargs)
+    with _matplotlib_disabled(fast):
+        return _reduce_boxes(multi_flat(entities, fast=fast, cache=cache))
+
+
+@contextmanager
+def _matplotlib_disabled(disable: bool):
+    """Disables the usage of `matplotlib` for the text size calculation if
+    `disable` is ``True`` and restores the previous state also in case of an
+    exception. Does not touch the global options if `disable` is ``False``.
+    """
+    if not disable:
+        yield
+        return
     use_matplotlib = ezdxf.options.use_matplotlib  # save current state
-    if fast:
-        ezdxf.options.use_matplotlib = False
-    _extends = BoundingBox()
-    for box in multi_flat(entities, fast=fast, cache=cache):
-        _extends.extend(box)
-    ezdxf.options.use_matplotlib = use_matplotlib  # restore state
-    return _extends
+    ezdxf.options.use_matplotlib = False
+    try:
+        yield
+    finally:
+        ezdxf.options.use_matplotlib = use_matplotlib  # restore state
+
+
+def _reduce_boxes(boxes: Iterable[BoundingBox]) -> BoundingBox:
+    """Returns the union of all given `boxes`, all boxes must have data.
+
+    The boxes are processed in chunks and reduced by the builtin :func:`min`
+    and :func:`max` functions, which avoids the vertex list rebuilding of
+    :meth:`BoundingBox.extend` for each box.
+
+    """
+    minx, miny, minz = math.inf, math.inf, math.inf
+    maxx, maxy, maxz = -math.inf, -math.inf, -math.inf
+    has_data = False
+    boxes = iter(boxes)
+    while True:
+        chunk = list(itertools.islice(boxes, _REDUCE_CHUNK_SIZE))
+        if not chunk:
+            break
+        has_data = True
+        xs, ys, zs = zip(*[box.extmin for box in chunk])
+        minx = min(minx, min(xs))
+        miny = min(miny, min(ys))
+        minz = min(minz, min(zs))
+        xs, ys, zs = zip(*[box.extmax for box in chunk])
+        maxx = max(maxx, max(xs))
+        maxy = max(maxy, max(ys))
+        maxz = max(maxz, max(zs))
+
+    if has_data:
+        return BoundingBox.from_extents(
+            Vec3(minx, miny, minz), Vec3(maxx, maxy, maxz)
+        )
+    return BoundingBox()
 
 
 def multi_flat(
@@ -191,24 +264,28 @@ def multi_flat(
         replaced argument `flatten` by argument `fast`
 
     """
+    fast = _resolve_fast_arg(fast, kwargs)
 
     def extends_(entities_: Iterable["DXFEntity"]) -> BoundingBox:
-        _extends = BoundingBox()
-        for _box in multi_recursive(
-            entities_, fast=_resolve_fast_arg(fast, kwargs), cache=cache
-        ):
-            _extends.extend(_box)
-        return _extends
+        # multi_recursive() yields only bounding boxes with data:
+        boxes = list(multi_recursive(entities_, fast=fast, cache=cache))
+        if len(boxes) > 1:
+            return _reduce_boxes(boxes)
+        # Fast path for the common case of a single primitive, returns a new
+        # box, which is not shared with the cache entry of the primitive:
+        return boxes[0].copy() if boxes else BoundingBox()
 
     for entity in entities:
+        key = None
         box = None
         if cache:
-            box = cache.get(entity)
+            key, box = cache._get_with_key(entity)
 
         if box is None:
             box = extends_([entity])
+            if not box.has_data:
+                continue
             if cache:
-                cache.store(entity, box)
-
-        if box.has_data:
-            yield box
+                cache._store_by_key(key, box)
+        # cached bounding boxes always have data
+        yield box
@@ -190,8 +190,13 @@ class LinePrimitive(Primitive):
         yield e.dxf.end
 
     def bbox(self, fast=False) -> BoundingBox:
-        e = self.entity
-        return BoundingBox((e.dxf.start, e.dxf.start))
+        dxf = self.entity.dxf
+        x0, y0, z0 = dxf.start
+        x1, y1, z1 = dxf.end
+        return BoundingBox.from_extents(
+            Vec3(min(x0, x1), min(y0, y1), min(z0, z1)),
+            Vec3(max(x0, x1), max(y0, y1), max(z0, z1)),
+        )
 
 
 class LwPolylinePrimitive(ConvertedPrimitive):
@@ -228,7 +233,8 @@ class PointPrimitive(Primitive):
         yield self.entity.dxf.location
 
     def bbox(self, fast=False) -> BoundingBox:
-        return BoundingBox((self.entity.dxf.location, ))
+        location = Vec3(self.entity.dxf.location)
+        return BoundingBox.from_extents(location, location)
 
 
 class MeshPrimitive(ConvertedPrimitive):
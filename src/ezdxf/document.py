@@ -93,6 +93,9 @@ CONST_MARKER_STRING = "0.0 @ 2000-01-01T00:00:00.000000+00:00"
 CREATED_BY_EZDXF = "CREATED_BY_EZDXF"
 WRITTEN_BY_EZDXF = "WRITTEN_BY_EZDXF"
 EZDXF_META = "EZDXF_META"
+# DXF files are written tag by tag, a bigger file buffer than the default
+# buffer size of 8kB reduces the count of system calls for large files:
+FILE_BUFFER_SIZE = 1 << 20
 
 
 def _validate_handle_seed(seed: str) -> str:
@@ -543,10 +546,14 @@ class Drawing:
 
         if fmt.startswith("asc"):
             fp = io.open(
-                self.filename, mode="wt", encoding=enc, errors="dxfreplace"  # type: ignore
+                self.filename,  # type: ignore
+                mode="wt",
+                encoding=enc,
+                errors="dxfreplace",
+                buffering=FILE_BUFFER_SIZE,
             )
         elif fmt.startswith("bin"):
-            fp = open(self.filename, "wb")  # type: ignore
+            fp = open(self.filename, "wb", buffering=FILE_BUFFER_SIZE)  # type: ignore
         else:
             raise ValueError(f"Unknown output format: '{fmt}'.")
         try:
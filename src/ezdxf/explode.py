@@ -341,6 +341,11 @@ def _virtual_edge_path(
     def pnt_to_wcs(v):
         return ocs.to_wcs(Vec3(v).replace(z=elevation))
 
+    def pnts_to_wcs(vertices):
+        return list(
+            ocs.points_to_wcs(Vec3(v).replace(z=elevation) for v in vertices)
+        )
+
     def dir_to_wcs(v):
         return ocs.to_wcs(v)
 
@@ -375,11 +380,11 @@ def _virtual_edge_path(
             spline = Spline.new(dxfattribs=attribs)
             spline.dxf.degree = edge.degree
             spline.knots = edge.knot_values
-            spline.control_points = [pnt_to_wcs(v) for v in edge.control_points]
+            spline.control_points = pnts_to_wcs(edge.control_points)
             if edge.weights:
                 spline.weights = edge.weights
             if edge.fit_points:
-                spline.fit_points = [pnt_to_wcs(v) for v in edge.fit_points]
+                spline.fit_points = pnts_to_wcs(edge.fit_points)
             if edge.start_tangent is not None:
                 spline.dxf.start_tangent = dir_to_wcs(edge.start_tangent)
             if edge.end_tangent is not None:
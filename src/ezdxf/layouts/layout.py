@@ -29,6 +29,22 @@ if TYPE_CHECKING:
     )
 
 
+# key: lower case units name
+# value: (paper size units name, plot_paper_units, unit factor to mm)
+_PAPER_UNITS = {
+    "mm": ("MM", 1, 1.0),
+    "inch": ("Inches", 0, 25.4),
+    "inches": ("Inches", 0, 25.4),
+}
+
+
+def _get_paper_units(units: str) -> Tuple[str, int, float]:
+    try:
+        return _PAPER_UNITS[units.lower()]
+    except KeyError:
+        raise const.DXFValueError('Supported units: "mm" and "inch"')
+
+
 def get_block_entity_space(
     doc: "Drawing", block_record_handle: str
 ) -> "EntitySpace":
@@ -86,6 +102,9 @@ class Layout(BaseLayout):
         # link maybe broken
         block_record.dxf.layout = layout.dxf.handle
         super().__init__(block_record)
+        # The handle of the BLOCK_RECORD is immutable, renaming the layout or
+        # setting the active layout does not change the layout key:
+        self._layout_key: str = block_record.dxf.handle
 
     @classmethod
     def new(
@@ -139,6 +158,11 @@ class Layout(BaseLayout):
         """
         return self.dxf_layout.dxf
 
+    @property
+    def layout_key(self) -> str:
+        # cached BLOCK_RECORD handle, see BaseLayout.layout_key
+        return self._layout_key
+
     @property
     def block_record_name(self) -> str:
         """Returns the name of the associated BLOCK_RECORD as string."""
@@ -148,13 +172,14 @@ class Layout(BaseLayout):
         """Set `owner` and `paperspace` attributes of entities hosted by this
         layout to correct values.
         """
-        layout_key = self.layout_key
+        layout_key = self._layout_key
         paperspace = 0 if self.is_modelspace else 1
         for entity in self:
-            if entity.dxf.owner != layout_key:
-                entity.dxf.owner = layout_key
-            if entity.dxf.paperspace != paperspace:
-                entity.dxf.paperspace = paperspace
+            dxf = entity.dxf
+            if dxf.owner != layout_key:
+                dxf.owner = layout_key
+            if dxf.paperspace != paperspace:
+                dxf.paperspace = paperspace
 
     def __contains__(self, entity: Union["DXFGraphic", str]) -> bool:
         """Returns ``True`` if `entity` is stored in this layout.
@@ -165,7 +190,7 @@ class Layout(BaseLayout):
         """
         if isinstance(entity, str):  # entity is a handle string
             entity = self.entitydb[entity]  # type: ignore
-        return entity.dxf.owner == self.layout_key  # type: ignore
+        return entity.dxf.owner == self._layout_key  # type: ignore
 
     def destroy(self) -> None:
         """Delete all entities and the layout itself from entity database and
@@ -699,17 +724,7 @@ class Paperspace(Layout):
             raise const.DXFValueError("Scale denominator can't be 0.")
         paper_width, paper_height = size
         margin_top, margin_right, margin_bottom, margin_left = margins
-        units = units.lower()
-        if units.startswith("inch"):
-            units = "Inches"
-            plot_paper_units = 0
-            unit_factor = 25.4  # inch to mm
-        elif units == "mm":
-            units = "MM"
-            plot_paper_units = 1
-            unit_factor = 1.0
-        else:
-            raise const.DXFValueError('Supported units: "mm" and "inch"')
+        units, plot_paper_units, unit_factor = _get_paper_units(units)
 
         # Setup PLOTSETTINGS
         # all paper sizes in mm
@@ -811,17 +826,7 @@ class Paperspace(Layout):
         scale_factor = scale_denom / scale_num
 
         # TODO: don't know how to set inch or mm mode in R12
-        units = units.lower()
-        if units.startswith("inch"):
-            units = "Inches"
-            plot_paper_units = 0
-            unit_factor = 25.4  # inch to mm
-        elif units == "mm":
-            units = "MM"
-            plot_paper_units = 1
-            unit_factor = 1.0
-        else:
-            raise const.DXFValueError('Supported units: "mm" and "inch"')
+        units, plot_paper_units, unit_factor = _get_paper_units(units)
 
         # all viewport parameters are scaled paper space units
         def paper_units(value):
@@ -33,6 +33,9 @@ class Layouts:
         self.doc = doc
         # Store layout names in normalized form: key(name)
         self._layouts: Dict[str, Layout] = {}
+        # Store layouts by layout key (handle of the BLOCK_RECORD):
+        self._layouts_by_key: Dict[str, Layout] = {}
+        self._active_layout: Optional[Paperspace] = None
         # key: layout name as original case sensitive string; value: DXFLayout()
         self._dxf_layouts: "Dictionary" = cast(
             "Dictionary", self.doc.rootdict["ACAD_LAYOUT"]
@@ -65,12 +68,14 @@ class Layouts:
     def _add_layout(self, name: str, layout: Layout):
         layout.dxf.name = name
         self._layouts[key(name)] = layout
+        self._layouts_by_key[layout.layout_key] = layout
         self._dxf_layouts[name] = layout.dxf_layout
 
     def _discard(self, layout: "Layout"):
         name = layout.name
         self._dxf_layouts.discard(name)
         del self._layouts[key(name)]
+        self._layouts_by_key.pop(layout.layout_key, None)
 
     def setup_modelspace(self):
         """Modelspace setup. (internal API)"""
@@ -191,6 +196,7 @@ class Layouts:
                 layout = Paperspace(dxf_layout, self.doc)
             # assert name == layout.dxf.name
             self._layouts[key(name)] = layout
+            self._layouts_by_key[layout.layout_key] = layout
 
     def modelspace(self) -> Modelspace:
         """Returns the :class:`~ezdxf.layouts.Modelspace` layout."""
@@ -260,11 +266,9 @@ class Layouts:
         """Returns a layout by its `layout_key`. (internal API)"""
         assert isinstance(layout_key, str), type(layout_key)
         try:
-            block_record = self.doc.entitydb[layout_key]
-            dxf_layout = self.doc.entitydb[block_record.dxf.layout]
+            return self._layouts_by_key[layout_key]
         except KeyError:
             raise DXFKeyError(f'Layout with key "{layout_key}" does not exist.')
-        return self.get(dxf_layout.dxf.name)
 
     def get_active_layout_key(self):
         """Returns layout kay for the active paperspace layout.
@@ -291,6 +295,7 @@ class Layouts:
         blocks.rename_block(PAPER_SPACE_R2000, TMP_PAPER_SPACE_NAME)
         blocks.rename_block(new_active_paper_space_name, PAPER_SPACE_R2000)
         blocks.rename_block(TMP_PAPER_SPACE_NAME, new_active_paper_space_name)
+        self._active_layout = None
 
     def delete(self, name: str) -> None:
         """Delete layout `name` and destroy all entities in that layout.
@@ -319,13 +324,24 @@ class Layouts:
                     self.set_active_layout(layout_name)
                     break
         self._discard(layout)
+        self._active_layout = None
         layout.destroy()
 
     def active_layout(self) -> Paperspace:
         """Returns the active paperspace layout."""
+        active_layout = self._active_layout
+        # Verify cached layout, the BLOCK_RECORD could be renamed without
+        # notifying the layout manager:
+        if (
+            active_layout is not None
+            and active_layout.is_alive
+            and active_layout.is_active_paperspace
+        ):
+            return active_layout
         for layout in self:
             if layout.is_active_paperspace:
-                return cast(Paperspace, layout)
+                self._active_layout = cast(Paperspace, layout)
+                return self._active_layout
         raise DXFInternalEzdxfError("No active paperspace layout found.")
 
     def audit(self, auditor: "Auditor"):
@@ -182,6 +182,20 @@ class BoundingBox(AbstractBoundingBox):
     """
     __slots__ = ("extmin", "extmax")
 
+    @classmethod
+    def from_extents(cls, extmin: Vec3, extmax: Vec3) -> "BoundingBox":
+        """Returns a new bounding box for the given extents `extmin` and
+        `extmax` as :class:`Vec3` objects. The extents are not checked and
+        the vertex iteration of the constructor is bypassed.
+
+        .. versionadded:: 0.18
+
+        """
+        box = cls()
+        box.extmin = extmin
+        box.extmax = extmax
+        return box
+
     @property
     def is_empty(self) -> bool:
         """Returns ``True`` if the bounding box is empty or the bounding box
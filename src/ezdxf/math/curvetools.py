@@ -2,6 +2,7 @@
 #  License: MIT License
 from __future__ import annotations
 from typing import Iterable, Union, List, Sequence, Tuple, TypeVar
+from functools import lru_cache
 import math
 from ezdxf.math import (
     BSpline,
@@ -39,10 +40,19 @@ def quadratic_to_cubic_bezier(curve: Bezier3P) -> Bezier4P:
     .. versionadded:: 0.16
 
     """
-    start, control, end = curve.control_points
-    control_1 = start + 2 * (control - start) / 3
-    control_2 = end + 2 * (control - end) / 3
-    return Bezier4P((start, control_1, control_2, end))
+    return Bezier4P(_quadratic_to_cubic_controls(*curve.control_points))
+
+
+def _quadratic_to_cubic_controls(start: T, control: T, end: T) -> Tuple[T, ...]:
+    """Returns the control points of the cubic Bèzier curve for the control
+    points of a quadratic Bèzier curve (degree elevation).
+    """
+    return (
+        start,
+        start + 2 * (control - start) / 3,
+        end + 2 * (control - end) / 3,
+        end,
+    )
 
 
 def bezier_to_bspline(curves: Iterable[AnyBezier]) -> BSpline:
@@ -61,7 +71,8 @@ def bezier_to_bspline(curves: Iterable[AnyBezier]) -> BSpline:
     def get_points(bezier: AnyBezier):
         points = bezier.control_points
         if len(points) < 4:
-            return quadratic_to_cubic_bezier(bezier).control_points
+            # degree elevation without creating a Bezier4P() object:
+            return _quadratic_to_cubic_controls(*points)
         else:
             return points
 
@@ -89,24 +100,28 @@ def have_bezier_curves_g1_continuity(
     .. versionadded:: 0.16
 
     """
-    b1_pnts = tuple(b1.control_points)
-    b2_pnts = tuple(b2.control_points)
+    # The control_points property returns already a new tuple:
+    b1_pnts = b1.control_points
+    b2_pnts = b2.control_points
 
     if not b1_pnts[-1].isclose(b2_pnts[0]):
         return False  # start- and end point are not close enough
 
-    try:
-        te = (b1_pnts[-1] - b1_pnts[-2]).normalize()
-    except ZeroDivisionError:
+    te = b1_pnts[-1] - b1_pnts[-2]
+    ts = b2_pnts[1] - b2_pnts[0]
+    n1 = te.dot(te)  # squared magnitude
+    n2 = ts.dot(ts)
+    if n1 == 0.0 or n2 == 0.0:
         return False  # tangent calculation not possible
 
-    try:
-        ts = (b2_pnts[1] - b2_pnts[0]).normalize()
-    except ZeroDivisionError:
-        return False  # tangent calculation not possible
-
-    # 0 = normal; 1 = same direction; -1 = opposite direction
-    return math.isclose(te.dot(ts), 1.0, abs_tol=g1_tol)
+    d = te.dot(ts)
+    if d <= 0.0:
+        return False  # tangents are normal or in opposite direction
+    # The cosine of the angle between the tangents has to be close to 1:
+    # cos = d / sqrt(n1 * n2) >= 1 - g1_tol, squared to avoid sqrt() and
+    # the normalization of the tangents (valid for g1_tol < 1):
+    min_cos = 1.0 - g1_tol
+    return d * d >= min_cos * min_cos * n1 * n2
 
 
 def reverse_bezier_curves(curves: List[AnyBezier]) -> List[AnyBezier]:
@@ -137,20 +152,38 @@ def split_bezier(
         raise ValueError("2 or more control points required")
     if t < 0.0 or t > 1.0:
         raise ValueError("parameter `t` must be in range [0, 1]")
-    left: List[T] = []
-    right: List[T] = []
-
-    def split(points: Sequence[T]):
-        n: int = len(points) - 1
+    mt = 1.0 - t
+    count = len(control_points)
+    # unrolled de Casteljau's algorithm for cubic, quadratic and linear curves:
+    if count == 4:
+        p0, p1, p2, p3 = control_points
+        p01 = p0 * mt + p1 * t
+        p12 = p1 * mt + p2 * t
+        p23 = p2 * mt + p3 * t
+        p012 = p01 * mt + p12 * t
+        p123 = p12 * mt + p23 * t
+        p0123 = p012 * mt + p123 * t
+        return [p0, p01, p012, p0123], [p3, p23, p123, p0123]
+    if count == 3:
+        p0, p1, p2 = control_points
+        p01 = p0 * mt + p1 * t
+        p12 = p1 * mt + p2 * t
+        p012 = p01 * mt + p12 * t
+        return [p0, p01, p012], [p2, p12, p012]
+    if count == 2:
+        p0, p1 = control_points
+        p01 = p0 * mt + p1 * t
+        return [p0, p01], [p1, p01]
+
+    left: List[T] = [control_points[0]]
+    right: List[T] = [control_points[-1]]
+    points = list(control_points)
+    # Iterative de Casteljau's algorithm, the left curve is the first point
+    # and the right curve is the last point of each row:
+    while len(points) > 1:
+        points = [p0 * mt + p1 * t for p0, p1 in zip(points, points[1:])]
         left.append(points[0])
-        right.append(points[n])
-        if n == 0:
-            return
-        split(
-            tuple(points[i] * (1.0 - t) + points[i + 1] * t for i in range(n))
-        )
-
-    split(control_points)
+        right.append(points[-1])
     return left, right
 
 
@@ -163,6 +196,31 @@ def quadratic_bezier_from_3p(p1: UVec, p2: UVec, p3: UVec) -> Bezier3P:
 
     .. _pomax-2: https://pomax.github.io/bezierinfo/#pointcurves
 
+    """
+    return Bezier3P(_three_point_quadratic_controls(p1, p2, p3))
+
+
+def cubic_bezier_from_3p(p1: UVec, p2: UVec, p3: UVec) -> Bezier4P:
+    """Returns a cubic Bèzier curve :class:`Bezier4P` from three points.
+    The curve starts at `p1`, goes through `p2` and ends at `p3`.
+    (source: `pomax-2`_)
+
+    .. versionadded:: 0.17.2
+
+    """
+    # degree elevation without an intermediate Bezier3P object:
+    return Bezier4P(
+        _quadratic_to_cubic_controls(
+            *_three_point_quadratic_controls(p1, p2, p3)
+        )
+    )
+
+
+def _three_point_quadratic_controls(
+    p1: UVec, p2: UVec, p3: UVec
+) -> Tuple[Vec3, Vec3, Vec3]:
+    """Returns the control points of a quadratic Bèzier curve, which starts at
+    `p1`, goes through `p2` and ends at `p3`.
     """
 
     def u_func(t: float) -> float:
@@ -185,62 +243,126 @@ def quadratic_bezier_from_3p(p1: UVec, p2: UVec, p3: UVec) -> Bezier3P:
     u = u_func(t)
     c = s * u + e * (1.0 - u)
     a = b + (b - c) / ratio(t)
-    return Bezier3P([s, a, e])
-
-
-def cubic_bezier_from_3p(p1: UVec, p2: UVec, p3: UVec) -> Bezier4P:
-    """Returns a cubic Bèzier curve :class:`Bezier4P` from three points.
-    The curve starts at `p1`, goes through `p2` and ends at `p3`.
-    (source: `pomax-2`_)
-
-    .. versionadded:: 0.17.2
-
-    """
-    qbez = quadratic_bezier_from_3p(p1, p2, p3)
-    return quadratic_to_cubic_bezier(qbez)
+    return s, a, e
 
 
-def cubic_bezier_bbox(curve: Bezier4P, *, abs_tol=1e-12) -> BoundingBox:
+def cubic_bezier_bbox(
+    curve: Bezier4P, *, abs_tol=1e-12, accurate=True
+) -> BoundingBox:
     """Returns the :class:`~ezdxf.math.BoundingBox` of a cubic Bézier curve
     of type :class:`~ezdxf.math.Bezier4P`.
 
+    The accurate bounding box requires the calculation of the local extrema of
+    the curve, if argument `accurate` is ``False`` the bounding box of the
+    control points is returned, which always encloses the curve because of
+    the convex hull property of Bézier curves.
+
     .. versionadded:: 0.18
 
     """
-    cp = curve.control_points
-    points: List[Vec3] = [cp[0], cp[3]]
-    for p1, p2, p3, p4 in zip(*cp):
-        a = 3.0 * (-p1 + 3.0 * p2 - 3.0 * p3 + p4)
-        b = 6.0 * (p1 - 2.0 * p2 + p3)
-        c = 3.0 * (p2 - p1)
-        if abs(a) < abs_tol:
-            if abs(b) < abs_tol:
-                t = -c  # or skip this case?
-            else:
-                t = -c / b
-            if 0.0 < t < 1.0:
-                points.append((curve.point(t)))
-            continue
-
-        try:
-            sqrt_bb4ac = math.sqrt(b * b - 4.0 * a * c)
-        except ValueError:  # domain error
+    if not accurate:
+        return BoundingBox(curve.control_points)
+    # Bézier curves are often reused, e.g. by paths of text glyphs or
+    # repeated block references, the calculation is cached by the control
+    # points:
+    extmin, extmax = _cubic_bezier_extents(
+        tuple(curve.control_points), abs_tol
+    )
+    # The cached extents are immutable Vec3 objects, but the BoundingBox
+    # is mutable and has to be a new object for each call:
+    return BoundingBox.from_extents(extmin, extmax)
+
+
+def bezier_extents(
+    control_points: Sequence[AnyVec], abs_tol=1e-12
+) -> Tuple[Vec3, Vec3]:
+    """Returns the extents of a quadratic or cubic Bèzier curve as tuple
+    (extmin, extmax) for the given 3 or 4 control points, without creating
+    a Bèzier curve or a :class:`~ezdxf.math.BoundingBox` object.
+
+    (internal API)
+    """
+    if len(control_points) == 3:
+        control_points = _quadratic_to_cubic_controls(*control_points)
+    return _cubic_bezier_extents(tuple(control_points), abs_tol)
+
+
+@lru_cache(maxsize=256)
+def _cubic_bezier_extents(
+    control_points: Tuple[AnyVec, ...], abs_tol: float
+) -> Tuple[Vec3, Vec3]:
+    extmin: List[float] = []
+    extmax: List[float] = []
+    # The extrema of an axis depend only on the components of this axis,
+    # therefore the curve is evaluated only for the axis of the extrema:
+    for p1, p2, p3, p4 in zip(*control_points):  # x-, y- and z-axis
+        if p1 < p4:
+            vmin, vmax = p1, p4
+        else:
+            vmin, vmax = p4, p1
+        if vmin <= p2 <= vmax and vmin <= p3 <= vmax:
+            # The curve is inside the convex hull of the control points,
+            # the extrema of this axis are the start- and end point:
+            extmin.append(vmin)
+            extmax.append(vmax)
             continue
-        aa = 2.0 * a
-        t = (-b + sqrt_bb4ac) / aa
-        if 0.0 < t < 1.0:
-            points.append(curve.point(t))
-        t = (-b - sqrt_bb4ac) / aa
-        if 0.0 < t < 1.0:
-            points.append(curve.point(t))
-    return BoundingBox(points)
-
-
-def quadratic_bezier_bbox(curve: Bezier3P, *, abs_tol=1e-12) -> BoundingBox:
+        values = [p1, p4]
+        for t in _cubic_extrema_params(p1, p2, p3, p4, abs_tol):
+            mt = 1.0 - t
+            values.append(
+                mt * mt * mt * p1
+                + 3.0 * mt * mt * t * p2
+                + 3.0 * mt * t * t * p3
+                + t * t * t * p4
+            )
+        extmin.append(min(values))
+        extmax.append(max(values))
+    # Vec3() sets the z-axis to 0 for 2D curves:
+    return Vec3(extmin), Vec3(extmax)
+
+
+def _cubic_extrema_params(
+    p1: float, p2: float, p3: float, p4: float, abs_tol: float
+) -> List[float]:
+    """Returns the curve parameters in the range (0, 1) of the local extrema
+    of a cubic Bézier curve for a single axis.
+    """
+    # The roots of the derivative of the cubic Bézier curve:
+    # a * t² + b * t + c = 0
+    a = 3.0 * (-p1 + 3.0 * p2 - 3.0 * p3 + p4)
+    b = 6.0 * (p1 - 2.0 * p2 + p3)
+    c = 3.0 * (p2 - p1)
+    if abs(a) < abs_tol:
+        if abs(b) < abs_tol:
+            t = -c  # or skip this case?
+        else:
+            t = -c / b
+        return [t] if 0.0 < t < 1.0 else []
+
+    bb4ac = b * b - 4.0 * a * c
+    if bb4ac < 0.0:  # no real roots
+        return []
+    sqrt_bb4ac = math.sqrt(bb4ac)
+    aa = 2.0 * a
+    return [
+        t
+        for t in ((-b + sqrt_bb4ac) / aa, (-b - sqrt_bb4ac) / aa)
+        if 0.0 < t < 1.0
+    ]
+
+
+def quadratic_bezier_bbox(
+    curve: Bezier3P, *, abs_tol=1e-12, accurate=True
+) -> BoundingBox:
     """Returns the :class:`~ezdxf.math.BoundingBox` of a quadratic Bézier curve
     of type :class:`~ezdxf.math.Bezier3P`.
 
+    Returns the bounding box of the control points if argument `accurate` is
+    ``False``, see :func:`cubic_bezier_bbox`.
+
     .. versionadded:: 0.18
 
     """
+    if not accurate:
+        return BoundingBox(curve.control_points)
     return cubic_bezier_bbox(quadratic_to_cubic_bezier(curve), abs_tol=abs_tol)
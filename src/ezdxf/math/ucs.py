@@ -84,9 +84,8 @@ class OCS:
     def points_to_wcs(self, points: Iterable[UVec]) -> Iterable[UVec]:
         """Returns iterable of WCS vectors for OCS `points`."""
         if self.transform:
-            to_wcs = self.matrix.ocs_to_wcs
-            for point in points:
-                yield to_wcs(point)
+            # batch transformation by the unpacked matrix:
+            yield from self.matrix.transform_directions(points)
         else:
             yield from points
 
@@ -29,9 +29,8 @@ from ezdxf.math import (
     linear_vertex_spacing,
     inscribe_circle_tangent_length,
     cubic_bezier_arc_parameters,
-    cubic_bezier_bbox,
-    quadratic_bezier_bbox,
 )
+from ezdxf.math.curvetools import bezier_extents
 
 from ezdxf.query import EntityQuery
 
@@ -169,15 +168,17 @@ def precise_bbox(path: Path) -> BoundingBox:
         if cmd.type == Command.LINE_TO:
             points.append(cmd.end)
         elif cmd.type == Command.CURVE4_TO:
-            bb = cubic_bezier_bbox(
-                Bezier4P((start, cmd.ctrl1, cmd.ctrl2, cmd.end))  # type: ignore
+            # Calculate the extents directly from the control points without
+            # creating a Bezier4P() and a BoundingBox() object for each curve:
+            points.extend(
+                bezier_extents(
+                    (start, cmd.ctrl1, cmd.ctrl2, cmd.end)  # type: ignore
+                )
             )
-            points.append(bb.extmin)
-            points.append(bb.extmax)
         elif cmd.type == Command.CURVE3_TO:
-            bb = quadratic_bezier_bbox(Bezier3P((start, cmd.ctrl, cmd.end)))  # type: ignore
-            points.append(bb.extmin)
-            points.append(bb.extmax)
+            points.extend(
+                bezier_extents((start, cmd.ctrl, cmd.end))  # type: ignore
+            )
         elif cmd.type == Command.MOVE_TO:
             points.append(cmd.end)
         start = cmd.end
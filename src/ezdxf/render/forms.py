@@ -1194,35 +1194,43 @@ def torus(
     angle_span = arc_angle_span_rad(start_angle, end_angle)
     closed_torus = math.isclose(angle_span, math.tau)
     step_angle = angle_span / major_count
-    circle_profile = [
-        Vec3(v.x, 0, v.y)
-        for v in translate(
-            circle(minor_count, minor_radius, close=True),
-            Vec3(major_radius, 0, 0),
-        )
-    ]
+    # The circle profile in the xz-plane as (x, z) tuples, reversed order is
     # required for outwards pointing normals:
-    circle_profile.reverse()
-    if start_angle > 1e-9:
-        circle_profile = [v.rotate(start_angle) for v in circle_profile]
-    mesh = MeshVertexMerger()
-    start_profile = circle_profile
-    end_profile = [v.rotate(step_angle) for v in circle_profile]
-
+    profile = [
+        (major_radius + v.x, v.y)
+        for v in circle(minor_count, minor_radius, close=False)
+    ]
+    profile = profile[:1] + profile[:0:-1]
+
+    # Create all vertices by rotating the profile about the z-axis, the
+    # vertex index of profile vertex j of profile k is k * minor_count + j:
+    profile_count = major_count if closed_torus else major_count + 1
+    vertices: List[Vec3] = []
+    for k in range(profile_count):
+        angle = start_angle + k * step_angle
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        vertices.extend(Vec3(x * cos_a, x * sin_a, z) for x, z in profile)
+
+    faces: List[Sequence[int]] = []
     if not closed_torus and caps:  # add start cap
-        mesh.add_face(reversed(start_profile))
+        faces.append([0] + list(range(minor_count - 1, 0, -1)))
 
-    for _ in range(major_count):
-        for face in _quad_connection_faces(start_profile, end_profile):
-            mesh.add_face(face)
-        start_profile = end_profile
-        end_profile = [v.rotate(step_angle) for v in end_profile]
+    vertex_count = len(vertices)
+    for k in range(major_count):
+        start = k * minor_count
+        end = (start + minor_count) % vertex_count  # closed torus wraps around
+        for j in range(minor_count):
+            j1 = (j + 1) % minor_count
+            faces.append((start + j, start + j1, end + j1, end + j))
 
     if not closed_torus and caps:  # add end cap
-        # end_profile is rotated to the next profile!
-        mesh.add_face(start_profile)
+        start = major_count * minor_count
+        faces.append(list(range(start, start + minor_count)))
 
-    return MeshTransformer.from_builder(mesh)
+    mesh = MeshTransformer()
+    mesh.add_mesh(vertices=vertices, faces=faces)
+    return mesh
 
 
 def connection_faces(
@@ -145,6 +145,13 @@ class MLeaderStyleOverride:
         self.use_mtext_default_content = bool(
             self._property_override_flags & (1 << 18)
         )  # if False, what MTEXT content is used?
+        # The override flags do not change, resolve the overridden attributes
+        # only once:
+        self._overridden = frozenset(
+            name
+            for name, flag in OVERRIDE_FLAG.items()
+            if flag & self._property_override_flags
+        )
 
     def get(self, attrib_name: str) -> Any:
         # Set MLEADERSTYLE value as default value:
@@ -161,8 +168,7 @@ class MLeaderStyleOverride:
         return value
 
     def is_overridden(self, attrib_name: str) -> bool:
-        flag = OVERRIDE_FLAG.get(attrib_name, 0)
-        return bool(flag & self._property_override_flags)
+        return attrib_name in self._overridden
 
 
 def virtual_entities(
@@ -233,26 +239,26 @@ def copy_mtext_data(
     # MLEADERSTYLE has a flag "use_mtext_default_content", what else should be
     # used as content if this flag is false?
     mtext.text = mtext_data.default_content
-    dxf = mtext.dxf
+    assert mtext.doc is not None
     aci_color, true_color = decode_raw_color(mtext_data.color)
-    dxf.color = aci_color
+    attribs = {
+        "color": aci_color,
+        "insert": mtext_data.insert,
+        "style": get_text_style(mtext_data.style_handle, mtext.doc).dxf.name,
+        "text_direction": mtext_data.text_direction,
+        # ignore rotation!
+        "width": mtext_data.width * scale,
+        "line_spacing_factor": mtext_data.line_spacing_factor,
+        "line_spacing_style": mtext_data.line_spacing_style,
+        "flow_direction": mtext_data.flow_direction,
+        # alignment=attachment_point: 1=top left, 2=top center, 3=top right
+        "attachment_point": mtext_data.alignment,
+    }
     if true_color is not None:
-        dxf.true_color = true_color
-    dxf.insert = mtext_data.insert
-    assert mtext.doc is not None
-    mtext.dxf.style = get_text_style(
-        mtext_data.style_handle, mtext.doc
-    ).dxf.name
+        attribs["true_color"] = true_color
     if not mtext_data.extrusion.isclose(Z_AXIS):
-        dxf.extrusion = mtext_data.extrusion
-    dxf.text_direction = mtext_data.text_direction
-    # ignore rotation!
-    dxf.width = mtext_data.width * scale
-    dxf.line_spacing_factor = mtext_data.line_spacing_factor
-    dxf.line_spacing_style = mtext_data.line_spacing_style
-    dxf.flow_direction = mtext_data.flow_direction
-    # alignment=attachment_point: 1=top left, 2=top center, 3=top right
-    dxf.attachment_point = mtext_data.alignment
+        attribs["extrusion"] = mtext_data.extrusion
+    mtext.dxf.update(attribs)
 
 
 def make_mtext(mleader: MultiLeader) -> "MText":
@@ -363,6 +369,16 @@ class RenderEngine:
         )
         self.leader_aci_color: int = aci_color
         self.leader_true_color: Optional[int] = true_color
+        # Template of the DXF attributes for all leader lines without color
+        # override:
+        self._leader_line_attribs: Dict[str, Any] = {
+            "layer": self.layer,
+            "color": aci_color,
+            "linetype": self.linetype,
+            "lineweight": self.lineweight,
+        }
+        if true_color is not None:
+            self._leader_line_attribs["true_color"] = true_color
         self.leader_type: int = self.style.get("leader_type")
         self.has_text_frame = False
         self.has_dogleg: bool = bool(self.style.get("has_dogleg"))
@@ -370,6 +386,8 @@ class RenderEngine:
             head.index: head.handle for head in mleader.arrow_heads
         }
         self.arrow_head_handle = self.style.get("arrow_head_handle")
+        # resolved arrow block names by arrow head handle:
+        self._arrow_block_names: Dict[Optional[str], str] = dict()
         self.dxf_mtext_entity: Optional["MText"] = None
         self._dxf_mtext_extents: Optional[Tuple[float, float]] = None
         self.has_horizontal_attachment = bool(
@@ -432,8 +450,17 @@ class RenderEngine:
         return "Continuous"
 
     def arrow_block_name(self, index: int) -> str:
-        closed_filled = "_CLOSED_FILLED"
         handle = self.arrow_heads.get(index, self.arrow_head_handle)
+        try:
+            return self._arrow_block_names[handle]
+        except KeyError:
+            pass
+        name = self._resolve_arrow_block_name(handle)
+        self._arrow_block_names[handle] = name
+        return name
+
+    def _resolve_arrow_block_name(self, handle: Optional[str]) -> str:
+        closed_filled = "_CLOSED_FILLED"
         if handle is None or handle == "0":
             return closed_filled
         block_record = self.doc.entitydb.get(handle)
@@ -445,23 +472,18 @@ class RenderEngine:
             return closed_filled
         return block_record.dxf.name
 
-    def leader_line_attribs(self, raw_color: int = None) -> Dict:
-        aci_color = self.leader_aci_color
-        true_color = self.leader_true_color
-
+    def leader_line_attribs(self, raw_color: Optional[int] = None) -> Dict:
         # Ignore color override value BYBLOCK!
         if raw_color and raw_color is not colors.BY_BLOCK_RAW_VALUE:
+            attribs = dict(self._leader_line_attribs)
             aci_color, true_color = decode_raw_color(raw_color)
-
-        attribs = {
-            "layer": self.layer,
-            "color": aci_color,
-            "linetype": self.linetype,
-            "lineweight": self.lineweight,
-        }
-        if true_color is not None:
-            attribs["true_color"] = true_color
-        return attribs
+            attribs["color"] = aci_color
+            if true_color is not None:
+                attribs["true_color"] = true_color
+            else:
+                attribs.pop("true_color", None)
+            return attribs
+        return self._leader_line_attribs.copy()
 
     def add_content(self) -> None:
         # also check self.style.get("content_type") ?
@@ -646,7 +668,8 @@ class RenderEngine:
             return
 
         arrow_direction: Vec3 = get_arrow_direction(vertices)
-        raw_color: int = line.color
+        # The DXF attributes are the same for the arrow and all line segments:
+        line_attribs = self.leader_line_attribs(line.color)
         index: int = line.index
         block_name: str = self.create_arrow_block(self.arrow_block_name(index))
         arrow_size: float = self.context.arrow_head_size
@@ -655,15 +678,14 @@ class RenderEngine:
             location=vertices[0],
             direction=arrow_direction,
             scale=arrow_size,
-            color=raw_color,
+            attribs=line_attribs,
         )
         arrow_offset: Vec3 = arrow_direction * arrow_length(
             block_name, arrow_size
         )
         vertices[0] += arrow_offset
         if leader_type == 1:  # add straight lines
-            for s, e in zip(vertices, vertices[1:]):
-                self.add_dxf_line(s, e, raw_color)
+            self.add_dxf_lines(vertices, attribs=line_attribs)
         elif leader_type == 2:  # add spline
             if leader.has_horizontal_attachment:
                 end_tangent = _get_dogleg_vector(leader)
@@ -673,7 +695,7 @@ class RenderEngine:
                 vertices,
                 # tangent normalization is not required
                 tangents=[arrow_direction, end_tangent],
-                color=raw_color,
+                attribs=line_attribs,
             )
 
     def create_arrow_block(self, name: str) -> str:
@@ -686,9 +708,18 @@ class RenderEngine:
         return name
 
     def add_dxf_spline(
-        self, fit_points: List[Vec3], tangents=None, color: int = None
+        self,
+        fit_points: List[Vec3],
+        tangents=None,
+        color: int = None,
+        *,
+        attribs: Optional[Dict] = None,
     ):
-        attribs = self.leader_line_attribs(color)
+        # precalculated `attribs` have precedence over the `color` argument
+        if attribs is None:
+            attribs = self.leader_line_attribs(color)
+        else:
+            attribs = dict(attribs)
         spline = cast(
             "Spline",
             factory.new("SPLINE", dxfattribs=attribs, doc=self.doc),
@@ -698,23 +729,47 @@ class RenderEngine:
         )
         self.entities.append(spline)
 
-    def add_dxf_line(self, start: Vec3, end: Vec3, color: int = None):
-        attribs = self.leader_line_attribs(color)
+    def add_dxf_line(
+        self,
+        start: Vec3,
+        end: Vec3,
+        color: int = None,
+        *,
+        attribs: Optional[Dict] = None,
+    ):
+        # precalculated `attribs` have precedence over the `color` argument
+        if attribs is None:
+            attribs = self.leader_line_attribs(color)
+        else:
+            attribs = dict(attribs)
         attribs["start"] = start
         attribs["end"] = end
         self.entities.append(
             factory.new("LINE", dxfattribs=attribs, doc=self.doc)  # type: ignore
         )
 
+    def add_dxf_lines(self, vertices: List[Vec3], attribs: Dict):
+        """Add a LINE entity for each segment of the polyline `vertices`, all
+        lines share the same DXF attributes `attribs`.
+        """
+        for start, end in zip(vertices, vertices[1:]):
+            self.add_dxf_line(start, end, attribs=attribs)
+
     def add_arrow(
         self,
         name: str,
         location: Vec3,
         direction: Vec3,
         scale: float,
-        color: int,
+        color: Optional[int] = None,
+        *,
+        attribs: Optional[Dict] = None,
     ):
-        attribs = self.leader_line_attribs(color)
+        # precalculated `attribs` have precedence over the `color` argument
+        if attribs is None:
+            attribs = self.leader_line_attribs(color)
+        else:
+            attribs = dict(attribs)
         attribs["name"] = name
         if self.ocs is not None:
             location = self.ocs.from_wcs(location)
@@ -32,6 +32,16 @@ def test_set_units(modelspace):
     modelspace.units = 0
 
 
+def test_contains_entity_and_handle(doc):
+    msp = doc.modelspace()
+    psp = doc.layout()
+    line = msp.add_line((0, 0), (1, 0))
+    assert line in msp
+    assert line.dxf.handle in msp
+    assert line not in psp
+    assert line.dxf.handle not in psp
+
+
 def test_delete_entity():
     doc = ezdxf.new("R12")
     layout = doc.modelspace()
@@ -136,3 +146,18 @@ def test_create_layout(doc):
 
     layout.page_setup()  # default paper setup
     assert len(layout) == 1, "missing 'main' viewport entity"
+
+
+@pytest.mark.parametrize("units", ["inch", "Inches", "INCH"])
+def test_page_setup_in_inch(units):
+    layout = ezdxf.new().layouts.new("PageSetupInInch")
+    layout.page_setup(size=(11, 8.5), margins=(0, 0, 0, 0), units=units)
+    assert layout.dxf.plot_paper_units == 0
+    assert layout.dxf.paper_width == pytest.approx(11 * 25.4)
+    assert layout.dxf.paper_size.endswith("_Inches)")
+
+
+def test_page_setup_invalid_units(doc):
+    layout = doc.layouts.new("PageSetupInvalidUnits")
+    with pytest.raises(ezdxf.DXFValueError):
+        layout.page_setup(units="cm")
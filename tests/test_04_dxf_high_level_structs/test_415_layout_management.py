@@ -130,3 +130,37 @@ def test_rename_layout(doc):
 def test_rename_not_existing_layout(doc):
     with pytest.raises(ezdxf.DXFValueError):
         doc.layouts.rename("LayoutDoesNotExist", "XXX")
+
+
+def test_get_layout_by_key(doc):
+    layout = doc.layouts.new("GetLayoutByKey")
+    assert doc.layouts.get_layout_by_key(layout.layout_key) is layout
+
+    doc.layouts.rename("GetLayoutByKey", "GetLayoutByKeyRenamed")
+    assert doc.layouts.get_layout_by_key(layout.layout_key) is layout
+
+    layout_key = layout.layout_key
+    doc.layouts.delete("GetLayoutByKeyRenamed")
+    with pytest.raises(ezdxf.DXFKeyError):
+        doc.layouts.get_layout_by_key(layout_key)
+
+
+def test_active_layout_follows_set_active_layout():
+    doc = ezdxf.new()
+    first = doc.layouts.active_layout()
+    second = doc.layouts.new("Second")
+    assert doc.layouts.active_layout() is first
+
+    doc.layouts.set_active_layout("Second")
+    assert doc.layouts.active_layout() is second
+
+    doc.layouts.delete("Second")
+    assert doc.layouts.active_layout() is first
+
+
+def test_layouts_with_same_taborder_are_sorted_by_name():
+    doc = ezdxf.new()
+    doc.layouts.new("ZLayout").dxf.taborder = 5
+    doc.layouts.new("ALayout").dxf.taborder = 5
+    names = doc.layouts.names_in_taborder()
+    assert names[-2:] == ["ALayout", "ZLayout"]
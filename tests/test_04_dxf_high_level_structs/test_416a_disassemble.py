@@ -50,6 +50,15 @@ def test_line_to_primitive():
     assert p.path is not None
     assert p.mesh is None
     assert list(p.vertices()) == [start, end]
+    assert p.bbox().extmin == start
+    assert p.bbox().extmax == end
+
+
+def test_bbox_of_line_primitive_in_reversed_direction():
+    e = factory.new("LINE", dxfattribs={"start": (4, 2, 6), "end": (1, 5, 3)})
+    box = disassemble.make_primitive(e).bbox()
+    assert box.extmin == (1, 2, 3)
+    assert box.extmax == (4, 5, 6)
 
 
 def test_lwpolyline_to_primitive():
@@ -5,6 +5,7 @@ import pytest
 import ezdxf
 from ezdxf.layouts import VirtualLayout
 from ezdxf import bbox, disassemble
+from ezdxf.math import BoundingBox
 from ezdxf.render.forms import square, translate
 
 
@@ -22,6 +23,20 @@ def test_extend(points1):
     assert box.extmax == (4, 5, 6)
 
 
+def test_extents_of_empty_entity_list():
+    box = bbox.extents([])
+    assert box.has_data is False
+
+
+def test_reduce_boxes():
+    boxes = [
+        BoundingBox([(x, -x, 0), (x + 1, -x + 1, x)]) for x in range(10000)
+    ]
+    box = bbox._reduce_boxes(boxes)
+    assert box.extmin == (0, -9999, 0)
+    assert box.extmax == (10000, 1, 9999)
+
+
 def solid_entities():
     lay = VirtualLayout()
     lay.add_solid(translate(square(1), (-10, -10)))
@@ -69,6 +84,17 @@ def test_cache_usage_with_uuids(points1):
     assert cache.hits == 18
 
 
+def test_cache_subclass_with_uuids(points1):
+    class MyCache(bbox.Cache):
+        pass
+
+    cache = MyCache(uuid=True)
+    assert type(cache) is MyCache
+    for _ in range(10):
+        bbox.extents(points1, cache=cache)
+    assert cache.hits == 18
+
+
 @pytest.fixture(scope="module")
 def msp_solids():
     return solid_blockrefs()
@@ -141,6 +167,24 @@ def test_cache_usage_with_uuids_for_reused_virtual_entities(msp_solids, func):
     assert cache.hits == 18
 
 
+def test_invalidate_cache_entries(msp_solids):
+    cache = bbox.Cache()
+    bbox.extents(msp_solids, cache=cache)
+    first, second = msp_solids
+    # ignores entities which are not stored in the cache:
+    cache.invalidate([first, first, *solid_entities()])
+    assert cache.get(first) is None
+    assert cache.get(second) is not None
+
+
+def test_cache_does_not_store_empty_bounding_boxes():
+    cache = bbox.Cache(uuid=True)
+    lay = VirtualLayout()
+    point = lay.add_point((0, 0))
+    cache.store(point, BoundingBox())
+    assert cache.get(point) is None
+
+
 @pytest.fixture
 def circle():
     lay = VirtualLayout()
@@ -154,6 +198,18 @@ def test_fast_bounding_box_calculation(circle):
     assert box.extmax == (+100, +100)
 
 
+def test_fast_mode_restores_matplotlib_option_on_error():
+    state = ezdxf.options.use_matplotlib
+
+    def entities():
+        yield from []
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        bbox.extents(entities(), fast=True)
+    assert ezdxf.options.use_matplotlib is state
+
+
 def test_precise_bounding_box_calculation(circle):
     box = bbox.extents(circle, fast=False)
     assert box.extmin == (-100, -100)
@@ -101,3 +101,14 @@ def test_matrix44_to_wcs():
         (-9.56460754, 8.44764172, 9.97894327),
         places=6,
     )
+
+
+def test_points_to_wcs():
+    ocs = OCS(EXTRUSION)
+    points = [
+        (9.41378764657076, 13.15481838975576, 0.8689258932616031),
+        (9.41378764657076, 1.745643639268379, 0.8689258932616031),
+    ]
+    expected = [ocs.to_wcs(p) for p in points]
+    assert list(ocs.points_to_wcs(points)) == expected
+    assert is_close_points(expected[0], (-9.56460754, 8.44764172, 9.97894327))
@@ -1,6 +1,7 @@
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
 import pytest
+import math
 import random
 
 from ezdxf.math import (
@@ -10,10 +11,12 @@ from ezdxf.math import (
     Bezier3P,
     quadratic_to_cubic_bezier,
     Bezier4P,
+    Bezier,
     have_bezier_curves_g1_continuity,
     bezier_to_bspline,
     split_bezier,
     quadratic_bezier_from_3p,
+    cubic_bezier_from_3p,
     close_vectors,
     cubic_bezier_bbox,
     quadratic_bezier_bbox,
@@ -88,6 +91,19 @@ def test_g1_continuity_for_bezier_curves():
     ), "end- and start point should match"
 
 
+@pytest.mark.parametrize(
+    "cos_angle, expected",
+    [(1.0, True), (1.0 - 0.5e-4, True), (1.0 - 2e-4, False), (-1.0, False)],
+)
+def test_g1_continuity_tolerance(cos_angle, expected):
+    angle = math.acos(cos_angle)
+    b1 = Bezier4P([(-3, 0), (-2, 0), (-1, 0), (0, 0)])
+    b2 = Bezier4P(
+        [(0, 0), Vec2.from_angle(angle, 2.0), (3, 3), (4, 4)]  # type: ignore
+    )
+    assert have_bezier_curves_g1_continuity(b1, b2, g1_tol=1e-4) is expected
+
+
 D1 = Bezier4P([(0, 0), (1, 1), (3, 0), (3, 0)])
 D2 = Bezier4P([(3, 0), (3, 0), (5, -1), (6, 0)])
 
@@ -140,6 +156,18 @@ def test_quality_of_bezier_to_bspline_conversion_2():
         assert p0.isclose(p1) is True, "conversion should be perfect"
 
 
+def test_mixed_bezier_curves_to_bspline():
+    b0 = Bezier3P([(-3, 0), (-1.5, 1.5), (0, 0)])
+    bspline = bezier_to_bspline([b0, B1, B2])
+    expected = list(quadratic_to_cubic_bezier(b0).control_points)
+    expected.extend(list(B1.control_points)[1:])
+    expected.extend(list(B2.control_points)[1:])
+    assert bspline.control_points == tuple(expected)
+    assert bspline.knots() == pytest.approx(
+        [0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3]
+    )
+
+
 def test_bezier_curves_to_bspline_error():
     with pytest.raises(ValueError):
         bezier_to_bspline([])  # one or more curves expected
@@ -159,6 +187,25 @@ class TestSplitBezier:
         with pytest.raises(ValueError):
             split_bezier([Vec2(0, 0)], 0.5)
 
+    @pytest.mark.parametrize("count", [2, 3, 4, 5])
+    @pytest.mark.parametrize("t", [0.0, 0.3, 1.0])
+    def test_split_bezier_of_any_degree(self, count, t):
+        points = [Vec3(i, (-1) ** i * i, i * i) for i in range(count)]
+        curve = Bezier(points)
+        left, right = split_bezier(points, t)
+        assert len(left) == len(right) == count
+        assert left[0].isclose(points[0])
+        assert right[0].isclose(points[-1])
+        point = curve.point(t)
+        assert left[-1].isclose(point)
+        assert right[-1].isclose(point)
+        # sub-curves of the left and the right part are part of the curve:
+        if 0.0 < t < 1.0:
+            assert Bezier(left).point(0.5).isclose(curve.point(t * 0.5))
+            assert Bezier(right).point(0.5).isclose(
+                curve.point(1.0 - (1.0 - t) * 0.5)
+            )
+
     def test_split_cubic_bezier(self, points3):
         left, right = split_bezier(points3, 0.5)
         assert (
@@ -184,10 +231,19 @@ def test_quadratic_bezier_from_3_points():
 
 
 def test_cubic_bezier_from_3_points():
-    cbez = quadratic_bezier_from_3p((0, 0), (3, 2), (6, 0))
+    cbez = cubic_bezier_from_3p((0, 0), (3, 2), (6, 0))
+    assert isinstance(cbez, Bezier4P)
     assert cbez.point(0.5).isclose((3, 2))
 
 
+def test_cubic_bezier_from_3_points_is_elevated_quadratic_curve():
+    points = [(0, 0), (1, 3), (6, 1)]
+    cbez = cubic_bezier_from_3p(*points)
+    expected = quadratic_to_cubic_bezier(quadratic_bezier_from_3p(*points))
+    for p0, p1 in zip(cbez.control_points, expected.control_points):
+        assert p0.isclose(p1)
+
+
 class TestBezierCurveBoundingBox:
     def test_linear_curve(self):
         bbox = cubic_bezier_bbox(Bezier4P([(0, 0), (1, 1), (2, 2), (3, 3)]))
@@ -219,7 +275,46 @@ class TestBezierCurveBoundingBox:
         assert bbox.extmax.y == pytest.approx(+2.25)
         assert bbox.extmax.z == pytest.approx(-0.25)
 
+    def test_cached_bounding_boxes_are_independent(self):
+        curve = Bezier4P([(0, 0), (0, 1), (2, 1), (2, 0)])
+        bbox1 = cubic_bezier_bbox(curve)
+        bbox1.grow(1.0)
+        bbox2 = cubic_bezier_bbox(Bezier4P(curve.control_points))
+        assert bbox1 is not bbox2
+        assert bbox2.extmin == (0, 0, 0)
+        assert bbox2.extmax.y == pytest.approx(0.75)
+
     def test_quadratic_bezier_curve_box(self):
         curve = Bezier3P([(0, 0), (1, 1), (2, 0)])
         bbox = quadratic_bezier_bbox(curve)
         assert bbox.extmax.y == pytest.approx(0.5)
+
+    def test_bezier_extents_of_control_points(self):
+        from ezdxf.math.curvetools import bezier_extents
+
+        extmin, extmax = bezier_extents(Vec3.list([(0, 0), (1, 1), (2, 0)]))
+        assert extmin.isclose((0, 0))
+        assert extmax.isclose((2, 0.5))
+        extmin, extmax = bezier_extents(
+            Vec3.list([(0, 0), (0, 1), (2, 1), (2, 0)])
+        )
+        assert extmax.isclose((2, 0.75))
+
+    def test_control_points_inside_of_end_points(self):
+        # the x-axis has no local extrema:
+        curve = Bezier4P([(0, 0), (0.5, 1), (1.5, 1), (2, 0)])
+        bbox = cubic_bezier_bbox(curve)
+        assert bbox.extmin.x == 0.0
+        assert bbox.extmax.x == 2.0
+        assert bbox.extmax.y == pytest.approx(0.75)
+
+    def test_inaccurate_cubic_bezier_curve_box(self):
+        curve = Bezier4P([(0, 0), (0, 1), (2, -1), (2, 0)])
+        bbox = cubic_bezier_bbox(curve, accurate=False)
+        assert bbox.extmin == (0, -1, 0)
+        assert bbox.extmax == (2, 1, 0)
+
+    def test_inaccurate_quadratic_bezier_curve_box(self):
+        curve = Bezier3P([(0, 0), (1, 1), (2, 0)])
+        bbox = quadratic_bezier_bbox(curve, accurate=False)
+        assert bbox.extmax.y == pytest.approx(1.0)
@@ -20,6 +20,12 @@ class TestBoundingBox:
         assert bbox.extmin == (-1, -2, -3)
         assert bbox.extmax == (7, 8, 9)
 
+    def test_from_extents(self):
+        bbox = BoundingBox.from_extents(Vec3(-1, -2, -3), Vec3(7, 8, 9))
+        assert bbox.extmin == (-1, -2, -3)
+        assert bbox.extmax == (7, 8, 9)
+        assert bbox.size == (8, 10, 12)
+
     def test_init_none(self):
         bbox = BoundingBox()
         assert bbox.is_empty is True
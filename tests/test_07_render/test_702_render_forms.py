@@ -235,6 +235,19 @@ class TestTorus:
         assert diag.n_faces == 16 * 8 + 2
         assert diag.is_manifold is True
 
+    def test_open_torus_cap_faces(self):
+        t = forms.torus(major_count=4, minor_count=8, end_angle=math.pi)
+        start_cap = t.faces[0]
+        end_cap = t.faces[-1]
+        assert len(start_cap) == len(set(start_cap)) == 8
+        assert len(end_cap) == len(set(end_cap)) == 8
+
+    def test_torus_without_caps(self):
+        t = forms.torus(
+            major_count=16, minor_count=8, end_angle=math.pi, caps=False
+        )
+        assert len(t.faces) == 16 * 8
+
     @pytest.mark.parametrize("r", [2, 1, -2])
     def test_major_radius_is_bigger_than_minor_radius(self, r):
         with pytest.raises(ValueError):
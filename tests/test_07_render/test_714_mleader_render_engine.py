@@ -3,6 +3,7 @@
 
 import pytest
 import ezdxf
+from ezdxf import colors
 from ezdxf.math import Vec2
 from ezdxf.render import mleader
 from ezdxf.entities import MText, MultiLeader, Insert
@@ -36,6 +37,57 @@ class TestRenderEngine:
         engine.add_mtext_content()
         assert isinstance(engine.entities[0], MText)
 
+    def test_add_leaders(self, doc):
+        ml = make_multi_leader(doc)
+        builder = mleader.MultiLeaderMTextBuilder(ml)
+        builder.set_content("line")
+        builder.add_leader_line(
+            mleader.ConnectionSide.left,
+            [Vec2(-20, -15), Vec2(-15, -10), Vec2(-10, -5)],
+        )
+        builder.build(insert=Vec2(0, 0))
+        engine = mleader.RenderEngine(ml, doc)
+        engine.add_leaders()
+        lines = [e for e in engine.entities if e.dxftype() == "LINE"]
+        assert len(lines) >= 2
+        assert lines[0].dxf.end.isclose(lines[1].dxf.start)
+        expected_color = engine.leader_line_attribs()["color"]
+        assert all(line.dxf.color == expected_color for line in lines)
+        assert engine.entities[0].dxftype() == "INSERT", "expected arrow"
+
+    def test_arrow_block_name(self, ml_mtext):
+        engine = mleader.RenderEngine(ml_mtext, ml_mtext.doc)
+        engine.arrow_heads[1] = "FEFE"  # does not exist
+        assert engine.arrow_block_name(1) == "_CLOSED_FILLED"
+        # resolved names are cached:
+        assert engine.arrow_block_name(1) == "_CLOSED_FILLED"
+        assert engine.arrow_block_name(2) == engine.arrow_block_name(3)
+
+    def test_leader_line_attribs(self, ml_mtext):
+        engine = mleader.RenderEngine(ml_mtext, ml_mtext.doc)
+        attribs = engine.leader_line_attribs()
+        assert attribs["color"] == engine.leader_aci_color
+        attribs["color"] = 7  # returns a copy of the template
+        assert engine.leader_line_attribs()["color"] == engine.leader_aci_color
+
+    def test_leader_line_attribs_color_override(self, ml_mtext):
+        engine = mleader.RenderEngine(ml_mtext, ml_mtext.doc)
+        raw_color = colors.encode_raw_color((1, 2, 3))
+        attribs = engine.leader_line_attribs(raw_color)
+        assert attribs["true_color"] == colors.rgb2int((1, 2, 3))
+
+
+def test_style_override_flags(doc):
+    ml = make_multi_leader(doc)
+    ml.dxf.property_override_flags = (
+        mleader.OVERRIDE_FLAG["leader_type"] | mleader.OVERRIDE_FLAG["scale"]
+    )
+    override = mleader.get_style(ml, doc)
+    assert override.is_overridden("leader_type") is True
+    assert override.is_overridden("scale") is True
+    assert override.is_overridden("text_color") is False
+    assert override.is_overridden("unknown_attribute") is False
+
 
 if __name__ == "__main__":
     pytest.main([__file__])